@@ -1,20 +1,26 @@
 import time
+import asyncio
 from pathlib import Path
+from functools import lru_cache
+from typing import Tuple, Optional
 
-from nonebot import require, on_command
 from nonebot.internal.adapter import Event
+from jinja2 import Template, Environment, FileSystemLoader
+from nonebot import logger, require, get_driver, on_command
 from nonebot.plugin import PluginMetadata, inherit_supported_adapters
 
+from .model import Feed
 from .utils import load_xml, atom_parser
+from .arxivreq.client import aclose_default_client, set_default_cache_dir
 
 require("nonebot_plugin_saa")
 require("nonebot_plugin_htmlrender")
 require("nonebot_plugin_localstore")
 
 import nonebot_plugin_saa as saa
-from nonebot_plugin_htmlrender import template_to_pic
+from nonebot_plugin_htmlrender import html_to_pic
 
-from .config import Config, plugin_config  # noqa: F401
+from .config import CACHE_DIR, Config, plugin_config
 
 __plugin_meta__ = PluginMetadata(
     name="nonebot_plugin_literature",
@@ -26,29 +32,62 @@ __plugin_meta__ = PluginMetadata(
     config=Config,
 )
 
+set_default_cache_dir(CACHE_DIR)
+get_driver().on_shutdown(aclose_default_client)
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+_ENV = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+
+@lru_cache
+def _get_template(name: str) -> Template:
+    """模板只在首次使用时编译，之后复用。"""
+    return _ENV.get_template(name)
+
+
+_feed_cache: Optional[Tuple[float, Feed]] = None
+_feed_lock: Optional[asyncio.Lock] = None
+
+
+async def _load_feed(path: Path) -> Feed:
+    """读取并解析 XML，文件未变动时直接复用上次的解析结果。"""
+    global _feed_cache, _feed_lock
+    if _feed_lock is None:
+        _feed_lock = asyncio.Lock()
+    async with _feed_lock:
+        mtime = (await asyncio.to_thread(path.stat)).st_mtime
+        if _feed_cache is None or _feed_cache[0] != mtime:
+            data = await asyncio.to_thread(load_xml, path)
+            _feed_cache = (mtime, await asyncio.to_thread(atom_parser, data))
+        return _feed_cache[1]
+
+
 literature = on_command("literature", aliases={"文献", "文献查询"}, priority=5)
 
 
 @literature.handle()
 async def _(event: Event):
     xml = Path(__file__).parent / "response.xml"
-    data = await atom_parser(await load_xml(xml))
-    template_path = str(Path(__file__).parent / "templates")
-    template_name = "test.html.jinja"
-    start_time = time.time()
-    pic = await template_to_pic(
-        template_path=template_path,
-        template_name=template_name,
-        templates={"feed": data},
-        pages={
-            "viewport": {"width": 600, "height": 300},
-            "base_url": f"file://{template_path}",
-        },
+    data = await _load_feed(xml)
+    start_time = time.perf_counter_ns()
+    html = _get_template("test.html.jinja").render(feed=data)
+    pic = await html_to_pic(
+        html=html,
+        template_path=f"file://{TEMPLATE_DIR}",
+        viewport={"width": 600, "height": 300},
+        base_url=f"file://{TEMPLATE_DIR}",
         wait=2,
     )
-    end_time = time.time()
-    duration = end_time - start_time  # 计算持续时间
+    duration_ms = (time.perf_counter_ns() - start_time) / 1e6
+    logger.debug("render took {:.2f} ms", duration_ms)
 
     msg_factory = saa.MessageFactory(saa.Image(pic))
-    await literature.send(str(duration))
+    if plugin_config.literature_debug:
+        await literature.send(f"{duration_ms:.2f} ms")
     await msg_factory.finish()
@@ -5,24 +5,37 @@ from __future__ import annotations
 import os
 import re
 import math
-import time
+import asyncio
 import logging
 import warnings
 from enum import Enum
 from calendar import timegm
-from typing import Generator
-from urllib.request import urlretrieve
+from urllib.parse import urlencode
+from functools import cached_property
 from datetime import datetime, timezone
+from typing import Any, Callable, Awaitable, NamedTuple, AsyncGenerator
 
-import feedparser
+import anyio
+import httpx
 
-from arxivreq.client import Client
-from arxivreq.exception import _classname
+from ._feed import FeedDict
+from ._cache import TTLCache
+from .exception import _classname
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_TIME = datetime.min
 
+_WS_RE = re.compile(r"\s+")
+_NONWORD_RE = re.compile(r"[^\w]")
+
+# The `Search` attributes its URL arguments are built from.
+_URL_ATTRS = frozenset(("query", "id_list", "sort_by", "sort_order"))
+
+# Converted fields of recently seen entries, keyed by entry id and update time.
+# Only immutable values are stored, so they can be shared between Results.
+_PARSED_ENTRIES: TTLCache[tuple[str, str | None], dict] = TTLCache(maxsize=1024, ttl=900.0)
+
 
 class Result:
     """
@@ -32,6 +45,23 @@ class Result:
     Returned](https://arxiv.org/help/api/user-manual#_details_of_atom_results_returned).
     """
 
+    __slots__ = (
+        "_raw",
+        "authors",
+        "categories",
+        "comment",
+        "doi",
+        "entry_id",
+        "journal_ref",
+        "links",
+        "pdf_url",
+        "primary_category",
+        "published",
+        "summary",
+        "title",
+        "updated",
+    )
+
     entry_id: str
     """A url of the form `https://arxiv.org/abs/{id}`."""
     updated: datetime
@@ -64,9 +94,9 @@ class Result:
     """Up to three URLs associated with this result."""
     pdf_url: str
     """The URL of a PDF version of this result if present among links."""
-    _raw: feedparser.FeedParserDict
+    _raw: FeedDict
     """
-    The raw feedparser result object if this Result was constructed with
+    The raw feed entry if this Result was constructed with
     Result._from_feed_entry.
     """
 
@@ -76,15 +106,15 @@ class Result:
         updated: datetime = _DEFAULT_TIME,
         published: datetime = _DEFAULT_TIME,
         title: str = "",
-        authors: list[Author] = [],
+        authors: list[Author] | None = None,
         summary: str = "",
         comment: str = "",
         journal_ref: str = "",
         doi: str = "",
         primary_category: str = "",
-        categories: list[str] = [],
-        links: list[Link] = [],
-        _raw: feedparser.FeedParserDict = None,
+        categories: list[str] | None = None,
+        links: list[Link] | None = None,
+        _raw: FeedDict | None = None,
     ):
         """
         Constructs an arXiv search result item.
@@ -96,50 +126,67 @@ class Result:
         self.updated = updated
         self.published = published
         self.title = title
-        self.authors = authors
+        self.authors = list(authors) if authors is not None else []
         self.summary = summary
         self.comment = comment
         self.journal_ref = journal_ref
         self.doi = doi
         self.primary_category = primary_category
-        self.categories = categories
-        self.links = links
+        self.categories = list(categories) if categories is not None else []
+        self.links = list(links) if links is not None else []
         # Calculated members
-        self.pdf_url = Result._get_pdf_url(links)
+        self.pdf_url = Result._get_pdf_url(self.links)
         # Debugging
         self._raw = _raw
 
-    def _from_feed_entry(entry: feedparser.FeedParserDict) -> Result:
+    def _from_feed_entry(entry: FeedDict) -> Result:
         """
-        Converts a feedparser entry for an arXiv search result feed into a
+        Converts a parsed entry of an arXiv search result feed into a
         Result object.
         """
-        if not hasattr(entry, "id"):
+        get = entry.get
+        entry_id = get("id")
+        if entry_id is None:
             raise Result.MissingFieldError("id")
         # Title attribute may be absent for certain titles. Defaulting to "0" as
         # it's the only title observed to cause this bug.
         # https://github.com/lukasschwab/arxiv.py/issues/71
-        # title = entry.title if hasattr(entry, "title") else "0"
-        title = "0"
-        if hasattr(entry, "title"):
-            title = entry.title
-        else:
-            logger.warning("Result %s is missing title attribute; defaulting to '0'", entry.id)
-        return Result(
-            entry_id=entry.id,
-            updated=Result._to_datetime(entry.updated_parsed),
-            published=Result._to_datetime(entry.published_parsed),
-            title=re.sub(r"\s+", " ", title),
-            authors=[Result.Author._from_feed_author(a) for a in entry.authors],
-            summary=entry.summary,
-            comment=entry.get("arxiv_comment"),
-            journal_ref=entry.get("arxiv_journal_ref"),
-            doi=entry.get("arxiv_doi"),
-            primary_category=entry.arxiv_primary_category.get("term"),
-            categories=[tag.get("term") for tag in entry.tags],
-            links=[Result.Link._from_feed_link(link) for link in entry.links],
-            _raw=entry,
-        )
+        title = get("title")
+        if title is None:
+            logger.warning("Result %s is missing title attribute; defaulting to '0'", entry_id)
+            title = "0"
+        # The same entry often shows up again in overlapping or repeated
+        # searches; reuse its converted fields instead of converting it again.
+        key = (entry_id, get("updated"))
+        fields = _PARSED_ENTRIES.get(key)
+        if fields is None:
+            author_cls = Result.Author
+            link_cls = Result.Link
+            # A required field missing from the feed would otherwise surface as a
+            # bare KeyError and end the whole search instead of skipping this entry.
+            try:
+                fields = {
+                    "updated": datetime.fromtimestamp(timegm(entry["updated_parsed"]), tz=timezone.utc),
+                    "published": datetime.fromtimestamp(timegm(entry["published_parsed"]), tz=timezone.utc),
+                    "title": _WS_RE.sub(" ", title),
+                    "authors": tuple(author_cls(a["name"]) for a in entry["authors"]),
+                    "summary": entry["summary"],
+                    "comment": get("arxiv_comment"),
+                    "journal_ref": get("arxiv_journal_ref"),
+                    "doi": get("arxiv_doi"),
+                    "primary_category": entry["arxiv_primary_category"].get("term"),
+                    "categories": tuple(tag.get("term") for tag in entry["tags"]),
+                    "links": tuple(
+                        link_cls(link["href"], link.get("title"), link.get("rel"), link.get("content_type"))
+                        for link in entry["links"]
+                    ),
+                }
+            except KeyError as e:
+                raise Result.MissingFieldError(e.args[0]) from None
+            _PARSED_ENTRIES.put(key, fields)
+        # Every call gets its own Result (and lists), so callers mutating one
+        # never affect another.
+        return Result(entry_id=entry_id, _raw=entry, **fields)
 
     def __str__(self) -> str:
         return self.entry_id
@@ -153,9 +200,10 @@ class Result:
         )
 
     def __eq__(self, other) -> bool:
-        if isinstance(other, Result):
-            return self.entry_id == other.entry_id
-        return False
+        return type(other) is Result and self.entry_id == other.entry_id
+
+    def __hash__(self) -> int:
+        return hash(self.entry_id)
 
     def get_short_id(self) -> str:
         """
@@ -182,7 +230,7 @@ class Result:
         return ".".join(
             [
                 self.get_short_id().replace("/", "_"),
-                re.sub(r"[^\w]", "_", nonempty_title),
+                _NONWORD_RE.sub("_", nonempty_title),
                 extension,
             ]
         )
@@ -191,18 +239,41 @@ class Result:
         """
         Downloads the PDF for this result to the specified directory.
 
+        The filename is generated by calling `to_filename(self)`.
+
+        Blocks until the download completes; from a running event loop use
+        `Result.adownload_pdf` instead.
+        """
+        return Result._run_download(self.adownload_pdf, dirpath, filename)
+
+    def download_source(self, dirpath: str = "./", filename: str = "") -> str:
+        """
+        Downloads the source tarfile for this result to the specified
+        directory.
+
+        The filename is generated by calling `to_filename(self)`.
+
+        Blocks until the download completes; from a running event loop use
+        `Result.adownload_source` instead.
+        """
+        return Result._run_download(self.adownload_source, dirpath, filename)
+
+    async def adownload_pdf(self, client: httpx.AsyncClient, dirpath: str = "./", filename: str = "") -> str:
+        """
+        Downloads the PDF for this result to the specified directory, streaming
+        it to disk through `client`.
+
         The filename is generated by calling `to_filename(self)`.
         """
         if not filename:
             filename = self._get_default_filename()
         path = os.path.join(dirpath, filename)
-        written_path, _ = urlretrieve(self.pdf_url, path)
-        return written_path
+        return await Result._adownload(client, self.pdf_url, path)
 
-    def download_source(self, dirpath: str = "./", filename: str = "") -> str:
+    async def adownload_source(self, client: httpx.AsyncClient, dirpath: str = "./", filename: str = "") -> str:
         """
         Downloads the source tarfile for this result to the specified
-        directory.
+        directory, streaming it to disk through `client`.
 
         The filename is generated by calling `to_filename(self)`.
         """
@@ -211,8 +282,40 @@ class Result:
         path = os.path.join(dirpath, filename)
         # Bodge: construct the source URL from the PDF URL.
         source_url = self.pdf_url.replace("/pdf/", "/src/")
-        written_path, _ = urlretrieve(source_url, path)
-        return written_path
+        return await Result._adownload(client, source_url, path)
+
+    async def _adownload(client: httpx.AsyncClient, url: str, path: str) -> str:
+        """
+        Streams the body at `url` into the file at `path` and returns the path.
+        """
+        async with client.stream("GET", url, follow_redirects=True) as response:
+            response.raise_for_status()
+            async with await anyio.open_file(path, "wb") as f:
+                async for chunk in response.aiter_bytes(65536):
+                    await f.write(chunk)
+        return path
+
+    def _run_download(
+        download: Callable[[httpx.AsyncClient, str, str], Awaitable[str]],
+        dirpath: str,
+        filename: str,
+    ) -> str:
+        """
+        Runs one of the async download methods to completion with a temporary
+        client. Refuses to run inside an event loop, where it would block it.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("Cannot download synchronously from a running event loop; use adownload_* instead")
+
+        async def run() -> str:
+            async with httpx.AsyncClient() as client:
+                return await download(client, dirpath, filename)
+
+        return asyncio.run(run())
 
     def _get_pdf_url(links: list[Link]) -> str:
         """
@@ -228,98 +331,40 @@ class Result:
             logger.warning("Result has multiple PDF links; using %s", pdf_urls[0])
         return pdf_urls[0]
 
-    def _to_datetime(ts: time.struct_time) -> datetime:
-        """
-        Converts a UTC time.struct_time into a time-zone-aware datetime.
-
-        This will be replaced with feedparser functionality [when it becomes
-        available](https://github.com/kurtmckee/feedparser/issues/212).
-        """
-        return datetime.fromtimestamp(timegm(ts), tz=timezone.utc)
-
-    class Author:
+    class Author(NamedTuple):
         """
         A light inner class for representing a result's authors.
+
+        Instances are immutable tuples, so equality and hashing compare the
+        author's name.
         """
 
         name: str
         """The author's name."""
 
-        def __init__(self, name: str):
-            """
-            Constructs an `Author` with the specified name.
-
-            In most cases, prefer using `Author._from_feed_author` to parsing
-            and constructing `Author`s yourself.
-            """
-            self.name = name
-
-        def _from_feed_author(feed_author: feedparser.FeedParserDict) -> Result.Author:
-            """
-            Constructs an `Author` with the name specified in an author object
-            from a feed entry.
-
-            See usage in `Result._from_feed_entry`.
-            """
-            return Result.Author(feed_author.name)
-
         def __str__(self) -> str:
             return self.name
 
         def __repr__(self) -> str:
             return f"{_classname(self)}({self.name!r})"
 
-        def __eq__(self, other) -> bool:
-            if isinstance(other, Result.Author):
-                return self.name == other.name
-            return False
-
-    class Link:
+    class Link(NamedTuple):
         """
         A light inner class for representing a result's links.
+
+        Instances are immutable tuples, so equality and hashing compare all
+        of the link's metadata.
         """
 
         href: str
         """The link's `href` attribute."""
-        title: str
+        title: str | None = None
         """The link's title."""
-        rel: str
+        rel: str | None = None
         """The link's relationship to the `Result`."""
-        content_type: str
+        content_type: str | None = None
         """The link's HTTP content type."""
 
-        def __init__(
-            self,
-            href: str,
-            title: str | None = None,
-            rel: str | None = None,
-            content_type: str | None = None,
-        ):
-            """
-            Constructs a `Link` with the specified link metadata.
-
-            In most cases, prefer using `Link._from_feed_link` to parsing and
-            constructing `Link`s yourself.
-            """
-            self.href = href
-            self.title = title
-            self.rel = rel
-            self.content_type = content_type
-
-        def _from_feed_link(feed_link: feedparser.FeedParserDict) -> Result.Link:
-            """
-            Constructs a `Link` with link metadata specified in a link object
-            from a feed entry.
-
-            See usage in `Result._from_feed_entry`.
-            """
-            return Result.Link(
-                href=feed_link.href,
-                title=feed_link.get("title"),
-                rel=feed_link.get("rel"),
-                content_type=feed_link.get("content_type"),
-            )
-
         def __str__(self) -> str:
             return self.href
 
@@ -329,11 +374,6 @@ class Result:
                 f"title={self.title!r}, rel={self.rel!r}, content_type={self.content_type!r})"
             )
 
-        def __eq__(self, other) -> bool:
-            if isinstance(other, Result.Link):
-                return self.href == other.href
-            return False
-
     class MissingFieldError(Exception):
         """
         An error indicating an entry is unparseable because it lacks required
@@ -384,7 +424,7 @@ class Search:
     """
     A specification for a search of arXiv's database.
 
-    To run a search, use `Search.run` to use a default client or `Client.run`
+    To run a search, use `Search.results` to use a default client or `AsyncClient.results`
     with a specific client.
     """
 
@@ -436,6 +476,27 @@ class Search:
         self.sort_by = sort_by
         self.sort_order = sort_order
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _URL_ATTRS:
+            # Rebuilt from the new criteria on next use.
+            self.__dict__.pop("_base_args", None)
+            self.__dict__.pop("_base_qs", None)
+
+    @cached_property
+    def _base_args(self) -> dict[str, str]:
+        # Paging aside, every request for this search shares these arguments.
+        return {
+            "search_query": self.query,
+            "id_list": ",".join(self.id_list),
+            "sortBy": self.sort_by.value,
+            "sortOrder": self.sort_order.value,
+        }
+
+    @cached_property
+    def _base_qs(self) -> str:
+        return urlencode(self._base_args)
+
     def __str__(self) -> str:
         # TODO: develop a more informative string representation.
         return repr(self)
@@ -452,23 +513,29 @@ class Search:
         Returns a dict of search parameters that should be included in an API
         request for this search.
         """
-        return {
-            "search_query": self.query,
-            "id_list": ",".join(self.id_list),
-            "sortBy": self.sort_by.value,
-            "sortOrder": self.sort_order.value,
-        }
+        return dict(self._base_args)
 
-    def results(self, offset: int = 0) -> Generator[Result, None, None]:
+    def encoded_url_args(self) -> str:
         """
-        Executes the specified search using a default arXiv API client. For info
-        on default behavior, see `Client.__init__` and `Client.results`.
+        Returns `url_args` URL-encoded as a query string. It is encoded once and
+        reused until the search criteria change.
+        """
+        return self._base_qs
+
+    def results(self, offset: int = 0) -> AsyncGenerator[Result, None]:
+        """
+        Executes the specified search using a default arXiv API client, which
+        shares the process-wide HTTP connection pool. For info on default
+        behavior, see `AsyncClient.__init__` and `AsyncClient.results`.
 
-        **Deprecated** after 2.0.0; use `Client.results`.
+        **Deprecated** after 2.0.0; use `AsyncClient.results`.
         """
         warnings.warn(
-            "The 'Search.results' method is deprecated, use 'Client.results' instead",
+            "The 'Search.results' method is deprecated, use 'AsyncClient.results' instead",
             DeprecationWarning,
             stacklevel=2,
         )
-        return Client().results(self, offset=offset)
+        # Imported here: the client module imports this one.
+        from .client import AsyncClient
+
+        return AsyncClient().results(self, offset=offset)
@@ -0,0 +1,141 @@
+"""
+Caches for arXiv API responses: an on-disk cache of response bodies,
+revalidated with conditional GETs so unchanged pages are not downloaded again,
+and a short-lived in-memory cache of parsed pages.
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Dict, Tuple, Union, Generic, TypeVar, Optional
+
+import anyio
+import httpx
+import msgspec
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPage(msgspec.Struct):
+    """A cached response body with the validators needed to revalidate it."""
+
+    content: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers asking the server to answer 304 if nothing changed."""
+        headers = {}
+        if self.etag:
+            headers["if-none-match"] = self.etag
+        if self.last_modified:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """
+    Stores one msgpack-encoded `CachedPage` per query URL under `directory`.
+
+    Only responses carrying an `ETag` or `Last-Modified` header are stored,
+    since without either there is no way to revalidate them. Once more than
+    `max_entries` pages are stored, the least recently written ones are deleted.
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"], max_entries: int = 512):
+        self.directory = anyio.Path(directory)
+        self.max_entries = max_entries
+
+    def _path(self, url: str) -> anyio.Path:
+        return self.directory / f"{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}.msgpack"
+
+    async def load(self, url: str) -> Optional[CachedPage]:
+        """Returns the cached page for `url`, or `None` if absent or unreadable."""
+        try:
+            data = await self._path(url).read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("Could not read cached page for %s: %s", url, e)
+            return None
+        try:
+            return msgspec.msgpack.decode(data, type=CachedPage)
+        except msgspec.DecodeError:
+            return None
+
+    async def store(self, url: str, response: httpx.Response) -> None:
+        """
+        Caches the body of `response` if it can be revalidated later. Failing to
+        write the cache is logged rather than raised.
+        """
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag is None and last_modified is None:
+            return
+        page = CachedPage(content=response.content, etag=etag, last_modified=last_modified)
+        try:
+            await self.directory.mkdir(parents=True, exist_ok=True)
+            await self._path(url).write_bytes(msgspec.msgpack.encode(page))
+            await asyncio.to_thread(self._evict)
+        except OSError as e:
+            # The response itself is fine; losing the cache entry only costs a refetch.
+            logger.warning("Could not cache page for %s: %s", url, e)
+
+    def _evict(self) -> None:
+        """Deletes the oldest pages beyond `max_entries`. Runs in a worker thread."""
+        with os.scandir(self.directory) as it:
+            pages = [entry for entry in it if entry.name.endswith(".msgpack")]
+        if len(pages) <= self.max_entries:
+            return
+        pages.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in pages[: len(pages) - self.max_entries]:
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+class TTLCache(Generic[K, V]):
+    """
+    A bounded in-memory mapping whose entries expire `ttl` seconds after they
+    are stored. Once `maxsize` entries are held, the least recently used one is
+    evicted.
+
+    Lookups and stores never await, so callers on one event loop need no lock.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 900.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> Optional[V]:
+        """Returns the live value stored under `key`, or `None`."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Stores `value` under `key`, evicting the least recently used entries if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,189 @@
+"""
+A small lxml-backed reader for arXiv's Atom feeds.
+
+`parse` produces objects shaped like feedparser's output for the subset of
+fields consumed by `Result._from_feed_entry` and the clients, so call sites can
+keep using `feed.entries`, `feed.feed.opensearch_totalresults`, `entry.authors`,
+`entry.arxiv_primary_category` and friends unchanged.
+"""
+
+from __future__ import annotations
+
+import time
+from io import BytesIO
+from typing import Callable
+from datetime import datetime
+
+from lxml import etree
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+_OPENSEARCH = "{http://a9.com/-/spec/opensearch/1.1/}"
+
+_FEED = _ATOM + "feed"
+_ENTRY = _ATOM + "entry"
+
+
+class FeedDict(dict):
+    """A `dict` with attribute access, mirroring `feedparser.FeedParserDict`."""
+
+    def __getattr__(self, name: str):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def _text(elem: etree._Element) -> str:
+    return (elem.text or "").strip()
+
+
+def _parse_date(value: str) -> time.struct_time | None:
+    """
+    Converts an RFC 3339 timestamp, as used throughout arXiv's feeds, into a UTC
+    `time.struct_time` like feedparser's `*_parsed` fields.
+    """
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).utctimetuple()
+    except ValueError:
+        return None
+
+
+def _text_field(key: str):
+    def handle(target: FeedDict, elem: etree._Element) -> None:
+        target[key] = _text(elem)
+
+    return handle
+
+
+def _date_field(key: str):
+    def handle(target: FeedDict, elem: etree._Element) -> None:
+        target[key] = value = _text(elem)
+        # Like feedparser, leave `*_parsed` out when the date is unparseable, so
+        # consumers treat it as a missing field.
+        parsed = _parse_date(value)
+        if parsed is not None:
+            target[key + "_parsed"] = parsed
+
+    return handle
+
+
+def _list_field(key: str, build: Callable[[etree._Element], FeedDict]):
+    def handle(target: FeedDict, elem: etree._Element) -> None:
+        target[key].append(build(elem))
+
+    return handle
+
+
+def _attrib_field(key: str):
+    def handle(target: FeedDict, elem: etree._Element) -> None:
+        target[key] = FeedDict(elem.attrib)
+
+    return handle
+
+
+def _parse_attrib(elem: etree._Element) -> FeedDict:
+    return FeedDict(elem.attrib)
+
+
+def _parse_tag(elem: etree._Element) -> FeedDict:
+    return FeedDict(term=elem.get("term"), scheme=elem.get("scheme"), label=None)
+
+
+_AUTHOR_FIELDS: dict[str, Callable[[FeedDict, etree._Element], None]] = {
+    _ATOM + "name": _text_field("name"),
+    _ARXIV + "affiliation": _text_field("arxiv_affiliation"),
+}
+
+
+def _parse_author(elem: etree._Element) -> FeedDict:
+    return _parse_children(FeedDict(), elem, _AUTHOR_FIELDS)
+
+
+_ENTRY_FIELDS: dict[str, Callable[[FeedDict, etree._Element], None]] = {
+    _ATOM + "id": _text_field("id"),
+    _ATOM + "title": _text_field("title"),
+    _ATOM + "summary": _text_field("summary"),
+    _ATOM + "updated": _date_field("updated"),
+    _ATOM + "published": _date_field("published"),
+    _ATOM + "author": _list_field("authors", _parse_author),
+    _ATOM + "category": _list_field("tags", _parse_tag),
+    _ATOM + "link": _list_field("links", _parse_attrib),
+    _ARXIV + "primary_category": _attrib_field("arxiv_primary_category"),
+    _ARXIV + "comment": _text_field("arxiv_comment"),
+    _ARXIV + "journal_ref": _text_field("arxiv_journal_ref"),
+    _ARXIV + "doi": _text_field("arxiv_doi"),
+}
+
+_FEED_FIELDS: dict[str, Callable[[FeedDict, etree._Element], None]] = {
+    _ATOM + "title": _text_field("title"),
+    _ATOM + "id": _text_field("id"),
+    _ATOM + "updated": _date_field("updated"),
+    _ATOM + "link": _list_field("links", _parse_attrib),
+    _OPENSEARCH + "totalResults": _text_field("opensearch_totalresults"),
+    _OPENSEARCH + "startIndex": _text_field("opensearch_startindex"),
+    _OPENSEARCH + "itemsPerPage": _text_field("opensearch_itemsperpage"),
+}
+
+
+def _parse_children(
+    target: FeedDict,
+    elem: etree._Element,
+    fields: dict[str, Callable[[FeedDict, etree._Element], None]],
+) -> FeedDict:
+    for child in elem:
+        handle = fields.get(child.tag)
+        if handle is not None:
+            handle(target, child)
+    return target
+
+
+def _parse_entry(elem: etree._Element) -> FeedDict:
+    return _parse_children(FeedDict(authors=[], tags=[], links=[]), elem, _ENTRY_FIELDS)
+
+
+def _parse(content: bytes) -> FeedDict:
+    feed = FeedDict(links=[])
+    entries = []
+    # Only entries and feed-level fields produce events; everything inside an
+    # entry is read from its subtree once the entry is complete.
+    context = etree.iterparse(
+        BytesIO(content),
+        events=("end",),
+        tag=[_ENTRY, *_FEED_FIELDS],
+        recover=True,
+        huge_tree=False,
+    )
+    for _, elem in context:
+        if elem.tag == _ENTRY:
+            entries.append(_parse_entry(elem))
+            # Drop the finished entry and everything before it so only the
+            # entry being parsed stays in memory.
+            elem.clear()
+            parent = elem.getparent()
+            while elem.getprevious() is not None:
+                del parent[0]
+            continue
+        parent = elem.getparent()
+        if parent is not None and parent.tag == _FEED:
+            _FEED_FIELDS[elem.tag](feed, elem)
+
+    result = FeedDict(feed=feed, entries=entries, bozo=0)
+    errors = context.error_log.filter_from_errors()
+    if errors:
+        result["bozo"] = 1
+        result["bozo_exception"] = errors.last_error
+    return result
+
+
+def parse(content: bytes) -> FeedDict:
+    """
+    Parses an arXiv Atom response body.
+
+    A body lxml cannot recover at all, e.g. an empty or non-XML one, yields a
+    feed without entries whose `bozo_exception` holds the parse error.
+    """
+    try:
+        return _parse(content)
+    except etree.XMLSyntaxError as e:
+        return FeedDict(feed=FeedDict(), entries=[], bozo=1, bozo_exception=e)
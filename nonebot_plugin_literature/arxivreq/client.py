@@ -1,16 +1,67 @@
 from __future__ import annotations
 
+import os
+import time
+import random
 import asyncio
-import functools
-from urllib.parse import urlencode
-from datetime import datetime, timedelta
-from typing import Callable, AsyncGenerator, cast
+from collections import deque
+from typing import AsyncGenerator, cast
 
 import httpx
-import feedparser
 
-from arxivreq import Result, Search, logger
-from arxivreq.exception import HTTPError, UnexpectedEmptyPageError
+from ._cache import TTLCache, PageCache
+from . import Result, Search, _feed, logger
+from .exception import UnexpectedEmptyPageError
+
+_UA_HEADERS = {"user-agent": "arxiv.py/2.1.0"}
+
+_DEFAULT_CLIENT: httpx.AsyncClient | None = None
+_DEFAULT_CACHE_DIR: str | os.PathLike[str] | None = None
+
+# Parsed pages keyed by query URL, shared by every client so repeated searches
+# and overlapping pagination are served without another rate-limited request.
+_PAGE_CACHE: TTLCache[str, _feed.FeedDict] = TTLCache(maxsize=128, ttl=900.0)
+
+
+def get_default_client() -> httpx.AsyncClient:
+    """
+    Returns the HTTP client shared by every arXiv client in the process,
+    creating it on first use so connections are pooled and kept alive across
+    searches, pages and retries.
+
+    :return: The shared asynchronous HTTP client.
+    :rtype: httpx.AsyncClient
+    """
+    global _DEFAULT_CLIENT
+    if _DEFAULT_CLIENT is None or _DEFAULT_CLIENT.is_closed:
+        _DEFAULT_CLIENT = httpx.AsyncClient(
+            http2=True,
+            headers=_UA_HEADERS,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=20, keepalive_expiry=60.0),
+        )
+    return _DEFAULT_CLIENT
+
+
+def set_default_cache_dir(directory: str | os.PathLike[str] | None) -> None:
+    """
+    Sets the directory clients cache response bodies in when they are created
+    without an explicit `cache_dir`, e.g. by `Search.results`. `None` turns the
+    default cache off again.
+    """
+    global _DEFAULT_CACHE_DIR
+    _DEFAULT_CACHE_DIR = directory
+
+
+async def aclose_default_client() -> None:
+    """
+    Closes the shared HTTP client, e.g. from the bot's shutdown hook. A new one
+    is created if it is needed again afterwards.
+    """
+    global _DEFAULT_CLIENT
+    if _DEFAULT_CLIENT is not None:
+        await _DEFAULT_CLIENT.aclose()
+        _DEFAULT_CLIENT = None
 
 
 class BasicClient:
@@ -20,11 +71,21 @@ class BasicClient:
 
     :var query_url_format: The arXiv query API endpoint format.
     :type query_url_format: str
+    :var max_retry_delay: The longest wait, in seconds, before retrying a failed request.
+    :type max_retry_delay: float
     """
 
     query_url_format: str = "https://export.arxiv.org/api/query?{}"
+    max_retry_delay: float = 30.0
 
-    def __init__(self, page_size: int = 100, delay_seconds: float = 3.0, num_retries: int = 3) -> None:
+    def __init__(
+        self,
+        page_size: int = 100,
+        delay_seconds: float = 3.0,
+        num_retries: int = 3,
+        concurrency: int = 2,
+        cache_dir: str | os.PathLike[str] | None = None,
+    ) -> None:
         """
         Initializes a BasicClient instance with the specified parameters.
 
@@ -34,13 +95,23 @@ class BasicClient:
         :type delay_seconds: float
         :param num_retries: Number of times to retry a failing API request before giving up.
         :type num_retries: int
+        :param concurrency: Maximum number of result pages fetched at the same time.
+        :type concurrency: int
+        :param cache_dir: Directory for caching response bodies across restarts; cached pages are
+                          revalidated with conditional requests. Defaults to the directory set with
+                          `set_default_cache_dir`; caching is disabled when neither is set.
+        :type cache_dir: str | os.PathLike[str] | None
         :note: The default parameters should provide a robust request strategy for most use cases.
-               Extreme page sizes, delays, or retries risk violating the arXiv API Terms of Use.
+               Extreme page sizes, delays, retries or concurrency risk violating the arXiv API Terms of Use.
         """
         self.page_size: int = page_size
         self.delay_seconds: float = delay_seconds
         self.num_retries: int = num_retries
-        self._last_request_dt: datetime | None = None
+        self.concurrency: int = concurrency
+        self._next_allowed_ts: float = 0.0
+        if cache_dir is None:
+            cache_dir = _DEFAULT_CACHE_DIR
+        self._cache: PageCache | None = PageCache(cache_dir) if cache_dir is not None else None
 
     def __str__(self) -> str:
         """
@@ -54,7 +125,16 @@ class BasicClient:
             f"delay_seconds={self.delay_seconds}, num_retries={self.num_retries})"
         )
 
-    async def _format_url(self, search: "Search", start: int, page_size: int) -> str:
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Returns the HTTP client used for requests; see `get_default_client`.
+
+        :return: The shared asynchronous HTTP client.
+        :rtype: httpx.AsyncClient
+        """
+        return get_default_client()
+
+    def _format_url(self, search: "Search", start: int, page_size: int) -> str:
         """
         Formats the URL for a query to the arXiv API.
 
@@ -67,9 +147,9 @@ class BasicClient:
         :return: The formatted URL as a string.
         :rtype: str
         """
-        url_args = search.url_args()
-        url_args.update({"start": str(start), "max_results": str(page_size)})
-        return self.query_url_format.format(urlencode(url_args))
+        # Only the paging arguments vary between pages; the rest of the query
+        # string is encoded once per search.
+        return self.query_url_format.format(f"{search.encoded_url_args()}&start={start}&max_results={page_size}")
 
     async def results(self, search: Search, offset: int = 0) -> AsyncGenerator[Result, None]:
         """
@@ -90,8 +170,7 @@ class BasicClient:
                 yield result
 
     async def _results(self, search: Search, offset: int = 0) -> AsyncGenerator[Result, None]:
-        page_url = await self._format_url(search, offset, self.page_size)
-        feed = await self._parse_feed(page_url, first_page=True)
+        feed = await self._fetch_page(search, offset, first_page=True)
         feed_dict = cast(dict, feed.feed)
         if not feed.entries:
             logger.info("Got empty first page; stopping generation")
@@ -102,68 +181,140 @@ class BasicClient:
             len(feed.entries),
             total_results,
         )
-
-        while feed.entries:
-            for entry in feed.entries:
-                try:
-                    yield Result._from_feed_entry(entry)
-                except Result.MissingFieldError as e:
-                    logger.warning("Skipping partial result: %s", e)
-            offset += len(feed.entries)
-            if offset >= total_results:
-                break
-            page_url = await self._format_url(search, offset, self.page_size)
-            feed = await self._parse_feed(page_url, first_page=False)
-
-    async def _parse_feed(self, url: str, first_page: bool = True, _try_index: int = 0) -> feedparser.FeedParserDict:
+        if search.max_results is not None:
+            total_results = min(total_results, search.max_results)
+
+        # Once the first page reports the total, the remaining offsets are known:
+        # keep up to `concurrency` of them in flight and yield them in order.
+        # Each pending page is tracked with the range it should cover.
+        pending: deque[tuple[int, int, asyncio.Task]] = deque()
+        next_offset = offset + len(feed.entries)
+        try:
+            while True:
+                while len(pending) < self.concurrency and next_offset < total_results:
+                    size = min(self.page_size, total_results - next_offset)
+                    task = asyncio.create_task(self._fetch_page(search, next_offset, first_page=False))
+                    pending.append((next_offset, size, task))
+                    next_offset += self.page_size
+                for entry in feed.entries:
+                    try:
+                        yield Result._from_feed_entry(entry)
+                    except Result.MissingFieldError as e:
+                        logger.warning("Skipping partial result: %s", e)
+                if not pending:
+                    break
+                start, size, task = pending.popleft()
+                feed = await task
+                if len(feed.entries) < size:
+                    # arXiv sometimes returns fewer entries than asked for;
+                    # request the rest before moving on to the following pages.
+                    missing_start, missing = start + len(feed.entries), size - len(feed.entries)
+                    logger.info("Got %d of %d results at %d; requesting the rest", len(feed.entries), size, start)
+                    task = asyncio.create_task(
+                        self._fetch_page(search, missing_start, first_page=False, page_size=missing)
+                    )
+                    pending.appendleft((missing_start, missing, task))
+        finally:
+            for _, _, task in pending:
+                task.cancel()
+
+    async def _fetch_page(
+        self, search: Search, start: int, first_page: bool, page_size: int | None = None
+    ) -> _feed.FeedDict:
         """
-        Asynchronously fetches the specified URL and parses it with feedparser.
+        Fetches the page of up to `page_size` results (by default the client's
+        `page_size`) starting at `start`, waiting first so that page requests
+        are dispatched at least `delay_seconds` apart. Pages parsed within the
+        last 15 minutes are reused without a request.
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()  # This will raise an exception for 4xx/5xx responses
-                content = response.content
-        except (httpx.HTTPStatusError, httpx.ConnectError) as err:
-            logger.debug("Got network error (try %d): %s", _try_index, err)
-            if _try_index < self.num_retries:
-                await asyncio.sleep(self.delay_seconds)  # Respect the delay between retries
-                return await self._parse_feed(url, first_page=first_page, _try_index=_try_index + 1)
-            else:
-                logger.debug("Giving up (try %d): %s", _try_index, err)
-                raise
-        except Exception as err:
-            logger.debug("Unexpected error: %s", err)
-            raise
-
-        # Parse the content using feedparser
-        feed = feedparser.parse(content)
+        page_url = self._format_url(search, start, page_size or self.page_size)
+        feed = _PAGE_CACHE.get(page_url)
+        if feed is not None:
+            logger.debug("Using recently parsed page: %s", page_url)
+            return feed
+        await self._wait_for_slot()
+        feed = await self._parse_feed(page_url, first_page=first_page)
+        # Empty or malformed pages are often transient on arXiv's side.
+        if feed.entries and not feed.bozo:
+            _PAGE_CACHE.put(page_url, feed)
         return feed
 
-    @staticmethod
-    def rate_limiter(func: Callable) -> Callable:
+    async def _parse_feed(self, url: str, first_page: bool = True) -> _feed.FeedDict:
         """
-        A decorator to enforce a delay between requests to the arXiv API.
+        Asynchronously fetches the specified URL and parses it as an Atom feed,
+        retrying network errors up to `num_retries` times with backoff.
 
-        :param func: The function to decorate with rate limiting.
-        :type func: Callable
-        :return: The decorated function with enforced delay.
-        :rtype: Callable
+        A page other than the first should never be empty; arXiv sporadically
+        returns one anyway, so that is retried as well, raising
+        `UnexpectedEmptyPageError` once the retries run out.
         """
+        client = self._get_client()
+        for try_index in range(self.num_retries + 1):
+            try:
+                cached = await self._cache.load(url) if self._cache is not None else None
+                headers = cached.conditional_headers() if cached is not None else None
+                response = await client.get(url, headers=headers)
+                if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+                    logger.debug("Page not modified; using cached copy: %s", url)
+                    response = None
+                    content = cached.content
+                else:
+                    response.raise_for_status()  # This will raise an exception for 4xx/5xx responses
+                    content = response.content
+                # Parsing is CPU-bound; keep it off the event loop.
+                feed = await asyncio.to_thread(_feed.parse, content)
+                if not first_page and not feed.entries:
+                    raise UnexpectedEmptyPageError(url, try_index, feed)
+                # Only store pages that parsed fine, so a transient empty page
+                # is never revalidated and reused from the cache.
+                if response is not None and self._cache is not None:
+                    await self._cache.store(url, response)
+                return feed
+            except (httpx.HTTPStatusError, httpx.ConnectError, httpx.ReadTimeout, UnexpectedEmptyPageError) as err:
+                logger.debug("Got error (try %d): %s", try_index, err)
+                if try_index >= self.num_retries:
+                    logger.debug("Giving up (try %d): %s", try_index, err)
+                    raise
+                await self._wait_for_slot(backoff=self._retry_delay(err, try_index))
+            except Exception as err:
+                logger.debug("Unexpected error: %s", err)
+                raise
 
-        @functools.wraps(func)
-        async def wrapper(self, *args, **kwargs):
-            if self._last_request_dt is not None:
-                required = timedelta(seconds=self.delay_seconds)
-                since_last_request = datetime.now() - self._last_request_dt
-                if since_last_request < required:
-                    to_sleep = (required - since_last_request).total_seconds()
-                    await asyncio.sleep(to_sleep)
-
-            self._last_request_dt = datetime.now()
-            return await func(self, *args, **kwargs)
+    def _retry_delay(self, err: Exception, try_index: int) -> float:
+        """
+        Returns how long to wait before retrying a request that failed with
+        `err` on try `try_index`.
 
-        return wrapper
+        Honors a numeric `Retry-After` on HTTP 429; otherwise backs off
+        exponentially from `delay_seconds`, with jitter so concurrent retries
+        spread out. Either way the wait is capped at `max_retry_delay`.
+        """
+        if isinstance(err, httpx.HTTPStatusError) and err.response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+            try:
+                return min(self.max_retry_delay, max(0.0, float(err.response.headers["retry-after"])))
+            except (KeyError, ValueError):
+                pass
+        return min(self.max_retry_delay, self.delay_seconds * 2**try_index) * random.uniform(0.5, 1.0)
+
+    async def _wait_for_slot(self, backoff: float = 0.0) -> None:
+        """
+        Reserves the next request slot and sleeps until it opens, so requests
+        start at least `delay_seconds` apart even when issued concurrently.
+        A retry passes its `backoff`, so its slot opens no sooner than that and
+        requests queued behind it are pushed back as well.
+
+        Slots are tracked on the monotonic clock, so wall-clock adjustments
+        cannot shorten or stretch the delay, and the reservation happens before
+        the first `await`, so concurrent callers each get a distinct slot and
+        queue up in call order without needing a lock.
+        """
+        now = time.monotonic()
+        start = max(now + backoff, self._next_allowed_ts)
+        self._next_allowed_ts = start + self.delay_seconds
+        to_sleep = start - now
+        if to_sleep > 0:
+            logger.info("Sleeping: %f seconds", to_sleep)
+            await asyncio.sleep(to_sleep)
 
 
 class AsyncClient(BasicClient):
@@ -171,29 +322,14 @@ class AsyncClient(BasicClient):
     An asynchronous client for fetching results from arXiv's API.
     """
 
-    def __init__(self, page_size: int = 100, delay_seconds: float = 3.0, num_retries: int = 3):
-        """
-        Initializes an AsyncClient instance with the specified parameters.
-
-        :param page_size: Maximum number of results fetched in a single API request.
-        :type page_size: int
-        :param delay_seconds: Number of seconds to wait between API requests.
-        :type delay_seconds: float
-        :param num_retries: Number of times to retry a failing API request before giving up.
-        :type num_retries: int
-        :note: The default parameters should provide a robust request strategy for most use cases.
-               Extreme page sizes, delays, or retries risk violating the arXiv API Terms of Use.
-        """
-        super().__init__(page_size, delay_seconds, num_retries)
-        self._async_client: httpx.AsyncClient = httpx.AsyncClient()
-
     async def results(self, search: Search, offset: int = 0) -> AsyncGenerator[Result, None]:
         """
         Uses this client configuration to fetch one page of the search results
         at a time, yielding the parsed `Result`s, until `max_results` results
         have been yielded or there are no more search results.
 
-        If all tries fail, raises an `UnexpectedEmptyPageError` or `HTTPError`.
+        If all tries fail, raises the last `httpx.HTTPError`, or
+        `UnexpectedEmptyPageError` if a page after the first stayed empty.
 
         Setting a nonzero `offset` discards leading records in the result set.
         When `offset` is greater than or equal to `search.max_results`, the full
@@ -207,82 +343,16 @@ class AsyncClient(BasicClient):
             return
 
         count = 0
-        async for result in self._aresults(search, offset):
+        async for result in self._results(search, offset):
             # Asynchronously fetches search results based on `search` criteria and `offset`.
-            # Uses an asynchronous generator to yield results from `_aresults`, which
-            # fetches results asynchronously.
+            # Uses an asynchronous generator to yield results from `_results`, which
+            # fetches up to `concurrency` pages ahead of the ones being yielded.
             # Initializes `count` to 0 to track the number of yielded results. Enters an
-            # async loop over `_aresults`. For each result, checks if the yielded result
+            # async loop over `_results`. For each result, checks if the yielded result
             # count has reached `limit`. If so, stops iteration.
             # If not at limit, yields the current result and increments `count` by 1.
-            # Continues until reaching the specified limit or exhausting `_aresults`.
+            # Continues until reaching the specified limit or exhausting `_results`.
             if limit is not None and count >= limit:
                 break
             yield result
             count += 1
-
-    async def _aresults(self, search: Search, offset: int = 0) -> AsyncGenerator[Result, None]:
-        page_url = self._format_url(search, offset, self.page_size)
-        feed = self._parse_feed(page_url, first_page=True)
-        if not feed.entries:
-            logger.info("Got empty first page; stopping generation")
-            return
-        total_results = int(feed.feed.opensearch_totalresults)
-        logger.info(
-            "Got first page: %d of %d total results",
-            len(feed.entries),
-            total_results,
-        )
-
-        while feed.entries:
-            for _ in feed.entries:
-                try:
-                    yield Result._from_feed_entry
-                except Result.MissingFieldError as e:
-                    logger.warning("Skipping partial result: %s", e)
-            offset += len(feed.entries)
-            if offset >= total_results:
-                break
-            page_url = self._format_url(search, offset, self.page_size)
-            feed = self._parse_feed(page_url, first_page=False)
-
-    @BasicClient.rate_limiter
-    async def _try_aparse_feed(
-        self,
-        url: str,
-        first_page: bool,
-        try_index: int,
-    ) -> feedparser.FeedParserDict:
-        """
-        Recursive helper for _parse_feed. Enforces `self.delay_seconds`: if that
-        number of seconds has not passed since `_parse_feed` was last called,
-        sleeps until delay_seconds seconds have passed.
-        """
-        # If this call would violate the rate limit, sleep until it doesn't.
-        if self._last_request_dt is not None:
-            required = timedelta(seconds=self.delay_seconds)
-            since_last_request = datetime.now() - self._last_request_dt
-            if since_last_request < required:
-                to_sleep = (required - since_last_request).total_seconds()
-                logger.info("Sleeping: %f seconds", to_sleep)
-                await asyncio.sleep(to_sleep)
-
-        logger.info("Requesting page (first: %r, try: %d): %s", first_page, try_index, url)
-
-        async with self._async_client as session:
-            resp = await session.get(url, headers={"user-agent": "arxiv.py/2.1.0"})
-            self._last_request_dt = datetime.now()
-            if resp.status_code != httpx.codes.OK:
-                raise HTTPError(url, try_index, resp.status_code)
-
-            feed = feedparser.parse(await resp.aread())
-            if len(feed.entries) == 0 and not first_page:
-                raise UnexpectedEmptyPageError(url, try_index, feed)
-
-            if feed.bozo:
-                logger.warning(
-                    "Bozo feed; consider handling: %s",
-                    feed.bozo_exception if "bozo_exception" in feed else None,
-                )
-
-            return feed
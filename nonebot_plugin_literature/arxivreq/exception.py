@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-import feedparser
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._feed import FeedDict
 
 
 class ArxivError(Exception):
@@ -39,13 +42,13 @@ class UnexpectedEmptyPageError(ArxivError):
     See `Client.results` for usage.
     """
 
-    raw_feed: feedparser.FeedParserDict
+    raw_feed: FeedDict
     """
-    The raw output of `feedparser.parse`. Sometimes this contains useful
-    diagnostic information, e.g. in 'bozo_exception'.
+    The parsed feed. Sometimes this contains useful diagnostic information,
+    e.g. in 'bozo_exception'.
     """
 
-    def __init__(self, url: str, retry: int, raw_feed: feedparser.FeedParserDict):
+    def __init__(self, url: str, retry: int, raw_feed: FeedDict):
         """
         Constructs an `UnexpectedEmptyPageError` encountered for the specified
         API URL after `retry` tries.
@@ -58,33 +61,6 @@ class UnexpectedEmptyPageError(ArxivError):
         return f"{_classname(self)}({self.url!r}, {self.retry!r}, {self.raw_feed!r})"
 
 
-class HTTPError(ArxivError):
-    """
-    A non-200 status encountered while fetching a page of results.
-
-    See `Client.results` for usage.
-    """
-
-    status: int
-    """The HTTP status reported by feedparser."""
-
-    def __init__(self, url: str, retry: int, status: int):
-        """
-        Constructs an `HTTPError` for the specified status code, encountered for
-        the specified API URL after `retry` tries.
-        """
-        self.url = url
-        self.status = status
-        super().__init__(
-            url,
-            retry,
-            f"Page request resulted in HTTP {self.status}",
-        )
-
-    def __repr__(self) -> str:
-        return f"{_classname(self)}({self.url!r}, {self.retry!r}, {self.status!r})"
-
-
 def _classname(o):
     """A helper function for use in __repr__ methods: arxiv.Result.Link."""
     return f"arxiv.{o.__class__.__qualname__}"
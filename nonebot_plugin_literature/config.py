@@ -1,22 +1,25 @@
-import re
-
 from nonebot import get_driver
-from nonebot_plugin_localstore import get_data_dir
 from pydantic import Extra, Field, HttpUrl, BaseModel, validator
+from nonebot_plugin_localstore import get_data_dir, get_cache_dir
 
 DATA_DIR = get_data_dir("nonebot_plugin_literature")
+CACHE_DIR = get_cache_dir("nonebot_plugin_literature")
 
 
 class Config(BaseModel, extra=Extra.ignore):
-    proxy: HttpUrl = Field(None, description="HTTP proxy to use for requests.")
+    proxy: HttpUrl = Field(None, description="HTTP(S) proxy to use for requests.")
     timeout: int = Field(30, description="Timeout for web requests in seconds.")
     literature_render: str = Field("htmlrender", description="Render type for literature.")
+    literature_debug: bool = Field(False, description="Send render timings back to the chat.")
 
     @validator("proxy")
     def check_proxy(cls, value):
-        if not re.match(r"^http://[^\s:]+:[0-9]+$", value):
-            raise ValueError("proxy 必须是 http://xxx:xxx 格式")
-        return {"http": value, "https": value}
+        # 按解析后的各部分校验，规范化后的字符串会省略协议的默认端口
+        if value.path not in (None, "", "/") or value.query or value.fragment:
+            raise ValueError("proxy 必须是 http(s)://xxx:xxx 格式")
+        proxy = f"{value.scheme}://{value.host}:{value.port}"
+        # httpx 的 mounts 格式
+        return {"http://": proxy, "https://": proxy}
 
     @validator("literature_render")
     def check_literature_render(cls, value):
@@ -26,4 +29,4 @@ class Config(BaseModel, extra=Extra.ignore):
 
 
 global_config = get_driver().config
-plugin_config = Config.parse_obj(global_config)
+plugin_config = Config.parse_obj(global_config.dict())
@@ -1,101 +1,161 @@
+import sys
+from io import BytesIO
 from pathlib import Path
-from typing import List, Union
-import xml.etree.ElementTree as ET
-
-import requests
-
-from nonebot_plugin_literature.model import Feed, Entry, Author
-
-response = requests.get("http://example.com/api/some_atom_feed")
+from typing import List, Union, Iterator
+
+import msgspec
+from lxml import etree
+
+from nonebot_plugin_literature.model import Feed, Entry
+
+NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "arxiv": "http://arxiv.org/schemas/atom",
+    "opensearch": "http://a9.com/-/spec/opensearch/1.1/",
+}
+# Clark notation 前缀，iterparse 的 tag 过滤与比较直接使用完整限定名
+ATOM = f"{{{NS['atom']}}}"
+OPENSEARCH = f"{{{NS['opensearch']}}}"
+
+FEED_TAG = ATOM + "feed"
+ENTRY_TAG = ATOM + "entry"
+FEED_LINK_TAG = ATOM + "link"
+FEED_FIELDS = {
+    ATOM + "title": "title",
+    ATOM + "id": "id",
+    ATOM + "updated": "updated",
+    OPENSEARCH + "totalResults": "total_results",
+    OPENSEARCH + "startIndex": "start_index",
+    OPENSEARCH + "itemsPerPage": "items_per_page",
+}
+
+
+def load_xml(data: Union[str, bytes, Path]) -> bytes:
+    """
+    Load XML data from a string, bytes or a file path.
+    :param data: XML data as a string or bytes, or a `Path` to an XML file.
+                 Strings are always treated as XML content, never as file paths.
+    :return: The raw XML document, to be parsed by `atom_parser`.
+    :raises FileNotFoundError: If the file path does not exist.
+    """
+    if isinstance(data, Path):
+        return data.read_bytes()
+    if isinstance(data, str):
+        return data.encode()
+    return data
+
+
+def _xpath(path: str) -> etree.XPath:
+    # smart_strings=False 使结果为普通字符串，不再引用所在的元素树，已解析的条目可以被释放
+    return etree.XPath(path, namespaces=NS, smart_strings=False)
+
+
+AUTHORS = _xpath("atom:author")
+AUTHOR_NAME = _xpath("atom:name/text()")
+AUTHOR_AFFILIATION = _xpath("arxiv:affiliation/text()")
+TITLE = _xpath("atom:title/text()")
+ID = _xpath("atom:id/text()")
+PUBLISHED = _xpath("atom:published/text()")
+UPDATED = _xpath("atom:updated/text()")
+SUMMARY = _xpath("atom:summary/text()")
+LINKS = _xpath("atom:link/@href")
+CATEGORIES = _xpath("atom:category/@term")
+PRIMARY_CATEGORY = _xpath("arxiv:primary_category/@term")
+COMMENT = _xpath("arxiv:comment/text()")
+JOURNAL_REF = _xpath("arxiv:journal_ref/text()")
+DOI = _xpath("arxiv:doi/text()")
+
+
+def find_text(element: etree._Element, xpath: etree.XPath) -> str:
+    """辅助函数，使用预编译的 XPath 安全地获取文本内容，如果找不到则返回空字符串。"""
+    result = xpath(element)
+    return result[0] if result else ""
+
+
+def _author_to_dict(author_elem: etree._Element) -> dict:
+    return {
+        "name": find_text(author_elem, AUTHOR_NAME),
+        "affiliation": sys.intern(find_text(author_elem, AUTHOR_AFFILIATION)),
+    }
 
 
-async def load_xml(data: Union[str, Path]) -> ET.Element:
+def _entry_to_dict(entry_elem: etree._Element) -> dict:
     """
-    Load XML data from a string or a file path.
-    :param data: XML data as a string or a file path.
-    :return: The root element of the XML.
-    :raises ET.ParseError: If the string data is not well-formed XML.
-    :raises FileNotFoundError: If the file path does not exist.
+    将单个条目读取为字典，由 msgspec 统一转换为 Entry。
+    分类与机构名在条目间大量重复，驻留后共享同一个字符串对象。
     """
-    if isinstance(data, Path) or (isinstance(data, str) and Path(data).is_file()):
-        if not Path(data).exists():
-            raise FileNotFoundError(f"File not found: {data}")
-        return ET.parse(str(data)).getroot()
-    else:
-        try:
-            return ET.fromstring(data)
-        except ET.ParseError as e:
-            raise ET.ParseError("String data is not well-formed XML.") from e
-
-
-def find_text(element: ET.Element, path: str, namespaces: dict) -> str:
-    """辅助函数，安全地获取XML元素的文本内容，如果找不到则返回空字符串。"""
-    found_element = element.find(path, namespaces)
-    # 确保即使是None也转换为字符串
-    return found_element.text if found_element is not None and found_element.text is not None else ""
-
-
-def parse_authors(entry_elem: ET.Element, ns: dict) -> List[Author]:
-    """解析作者信息。"""
-    return [
-        Author(
-            name=find_text(author_elem, "atom:name", ns),
-            affiliation=find_text(author_elem, "arxiv:affiliation", ns),
-        )
-        for author_elem in entry_elem.findall("atom:author", ns)
-    ]
-
-
-def parse_entry(entry_elem: ET.Element, ns: dict) -> Entry:
+    return {
+        "title": find_text(entry_elem, TITLE),
+        "id": find_text(entry_elem, ID),
+        "published": find_text(entry_elem, PUBLISHED),
+        "updated": find_text(entry_elem, UPDATED),
+        "summary": find_text(entry_elem, SUMMARY),
+        "authors": [_author_to_dict(author_elem) for author_elem in AUTHORS(entry_elem)],
+        "links": LINKS(entry_elem),
+        "categories": [sys.intern(category) for category in CATEGORIES(entry_elem)],
+        "primary_category": sys.intern(find_text(entry_elem, PRIMARY_CATEGORY)),
+        "comment": find_text(entry_elem, COMMENT),
+        "journal_ref": find_text(entry_elem, JOURNAL_REF),
+        "doi": find_text(entry_elem, DOI),
+    }
+
+
+def parse_entry(entry_elem: etree._Element) -> Entry:
     """解析单个条目。"""
-    authors = parse_authors(entry_elem, ns)
-    links = [link.get("href") for link in entry_elem.findall("atom:link", ns) if link.get("href") is not None]
-    categories = [
-        category.get("term") for category in entry_elem.findall("atom:category", ns) if category.get("term") is not None
-    ]
-    return Entry(
-        title=find_text(entry_elem, "atom:title", ns),
-        id=find_text(entry_elem, "atom:id", ns),
-        published=find_text(entry_elem, "atom:published", ns),
-        updated=find_text(entry_elem, "atom:updated", ns),
-        summary=find_text(entry_elem, "atom:summary", ns),
-        authors=authors,
-        links=links,
-        categories=categories,
-        primary_category=find_text(entry_elem, "arxiv:primary_category", ns),
-        comment=find_text(entry_elem, "arxiv:comment", ns),
-        journal_ref=find_text(entry_elem, "arxiv:journal_ref", ns),
-        doi=find_text(entry_elem, "arxiv:doi", ns),
-    )
+    return msgspec.convert(_entry_to_dict(entry_elem), Entry)
 
 
-async def atom_parser(data: ET.Element) -> Feed:
-    """解析 Atom feed。"""
-    ns = {
-        "atom": "http://www.w3.org/2005/Atom",
-        "arxiv": "http://arxiv.org/schemas/atom",
-        "opensearch": "http://a9.com/-/spec/opensearch/1.1/",
-    }
+def _release(elem: etree._Element) -> None:
+    """释放已解析完的元素及其之前的兄弟节点，使内存中只保留当前条目。"""
+    elem.clear()
+    parent = elem.getparent()
+    while elem.getprevious() is not None:
+        del parent[0]
+
+
+def iter_entries(data: bytes) -> Iterator[Entry]:
+    """
+    流式解析 Atom feed，逐条产出条目。
+    与 `atom_parser` 一样是 CPU 密集型操作，在异步代码中请放到工作线程中消费。
+    """
+    for _, elem in etree.iterparse(BytesIO(data), events=("end",), tag=ENTRY_TAG):
+        entry = parse_entry(elem)
+        _release(elem)
+        yield entry
 
-    feed_info = {
-        "title": find_text(data, "atom:title", ns),
-        "id": find_text(data, "atom:id", ns),
-        "updated": find_text(data, "atom:updated", ns),
-        "link": find_text(data, "atom:link", ns),
-        "total_results": int(find_text(data, "opensearch:totalResults", ns) or 0),
-        "start_index": int(find_text(data, "opensearch:startIndex", ns) or 0),
-        "items_per_page": int(find_text(data, "opensearch:itemsPerPage", ns) or 0),
-    }
 
-    entries = [parse_entry(entry_elem, ns) for entry_elem in data.findall("atom:entry", ns)]
+def atom_parser(data: bytes) -> Feed:
+    """
+    流式解析 Atom feed，每个条目解析完成后即释放其元素。
+    解析是 CPU 密集型操作，在异步代码中请通过 `asyncio.to_thread` 调用。
+    :raises etree.XMLSyntaxError: If the data is not well-formed XML.
+    """
+    feed_info = dict.fromkeys(FEED_FIELDS.values(), "")
+    feed_info["link"] = ""
+    entries = []
+
+    for _, elem in etree.iterparse(BytesIO(data), events=("end",), tag=[ENTRY_TAG, FEED_LINK_TAG, *FEED_FIELDS]):
+        if elem.tag == ENTRY_TAG:
+            entries.append(_entry_to_dict(elem))
+            _release(elem)
+            continue
+        parent = elem.getparent()
+        # 只读取 feed 自身的字段，条目内部的同名元素已在 parse_entry 中处理
+        if parent is None or parent.tag != FEED_TAG:
+            continue
+        if elem.tag == FEED_LINK_TAG:
+            feed_info["link"] = feed_info["link"] or elem.get("href", "")
+        else:
+            feed_info[FEED_FIELDS[elem.tag]] = elem.text or ""
 
     return Feed(
         title=feed_info["title"],
         id=feed_info["id"],
         updated=feed_info["updated"],
         link=feed_info["link"],
-        total_results=feed_info["total_results"],
-        start_index=feed_info["start_index"],
-        items_per_page=feed_info["items_per_page"],
-        entries=entries,
+        total_results=int(feed_info["total_results"] or 0),
+        start_index=int(feed_info["start_index"] or 0),
+        items_per_page=int(feed_info["items_per_page"] or 0),
+        # 一次性转换全部条目，而不是逐条构造
+        entries=msgspec.convert(entries, List[Entry]),
     )
@@ -0,0 +1,16 @@
+from pathlib import Path
+
+import pytest
+import nonebot
+
+RESPONSE_XML = Path(__file__).parent / "response.xml"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _load_plugin(nonebug_init: None) -> None:
+    nonebot.require("nonebot_plugin_literature")
+
+
+@pytest.fixture
+def response_xml() -> bytes:
+    return RESPONSE_XML.read_bytes()
@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from .test_client import _page
+
+ETAG = '"page-v1"'
+
+
+@pytest.fixture
+def request_headers(monkeypatch: pytest.MonkeyPatch) -> List[Dict[str, str]]:
+    """Serves the first page with an `ETag`, answering 304 once it is sent back, and records request headers."""
+    from nonebot_plugin_literature.arxivreq import client
+
+    requests: List[Dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.headers))
+        if request.headers.get("if-none-match") == ETAG:
+            return httpx.Response(304)
+        headers = {"etag": ETAG} if "validators" in request.url.params["search_query"] else {}
+        return httpx.Response(200, text=_page(0, 3, set()), headers=headers)
+
+    monkeypatch.setattr(client, "_DEFAULT_CLIENT", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(client, "_PAGE_CACHE", client.TTLCache())
+    return requests
+
+
+def _stored_pages(directory: Path) -> List[Path]:
+    return list(directory.iterdir())
+
+
+async def _titles(api, query: str) -> List[str]:
+    from nonebot_plugin_literature.arxivreq import Search, client
+
+    # Drop parsed pages so the second search goes back to the server.
+    client._PAGE_CACHE.clear()
+    return [result.title async for result in api.results(Search(query=query, max_results=3))]
+
+
+@pytest.mark.asyncio
+async def test_not_modified_page_is_served_from_disk(request_headers: List[Dict[str, str]], tmp_path: Path):
+    from nonebot_plugin_literature.arxivreq import client
+
+    api = client.BasicClient(page_size=3, delay_seconds=0.01, cache_dir=tmp_path)
+    first = await _titles(api, "validators")
+    second = await _titles(api, "validators")
+
+    assert first == second == ["Paper 0", "Paper 1", "Paper 2"]
+    assert "if-none-match" not in request_headers[0]
+    assert request_headers[1]["if-none-match"] == ETAG
+    assert len(_stored_pages(tmp_path)) == 1
+
+
+@pytest.mark.asyncio
+async def test_page_without_validators_is_not_cached(request_headers: List[Dict[str, str]], tmp_path: Path):
+    from nonebot_plugin_literature.arxivreq import client
+
+    api = client.BasicClient(page_size=3, delay_seconds=0.01, cache_dir=tmp_path)
+    first = await _titles(api, "plain")
+    second = await _titles(api, "plain")
+
+    assert first == second == ["Paper 0", "Paper 1", "Paper 2"]
+    assert all("if-none-match" not in headers for headers in request_headers)
+    assert _stored_pages(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_oldest_pages_are_evicted(tmp_path: Path):
+    from nonebot_plugin_literature.arxivreq._cache import PageCache
+
+    cache = PageCache(tmp_path, max_entries=2)
+    response = httpx.Response(200, content=b"<feed/>", headers={"etag": ETAG})
+    for index, url in enumerate(["a", "b", "c"]):
+        await cache.store(url, response)
+        # Spread the modification times so the write order is unambiguous.
+        os.utime(cache._path(url), ns=(index * 10**9, index * 10**9))
+
+    assert await cache.load("a") is None
+    assert await cache.load("b") is not None
+    assert await cache.load("c") is not None
@@ -0,0 +1,277 @@
+import time
+import asyncio
+from typing import Set, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+TOTAL_RESULTS = 7
+
+
+def _entry(index: int) -> str:
+    return (
+        "<entry>"
+        f"<id>http://arxiv.org/abs/2401.{index:05d}v1</id>"
+        "<updated>2024-01-01T00:00:00Z</updated>"
+        "<published>2024-01-01T00:00:00Z</published>"
+        f"<title>Paper {index}</title>"
+        "<summary>Summary</summary>"
+        "<author><name>Author</name></author>"
+        '<arxiv:primary_category xmlns:arxiv="http://arxiv.org/schemas/atom" term="cs.LG"/>'
+        "</entry>"
+    )
+
+
+def _page(start: int, count: int, partial: Set[int]) -> str:
+    entries = "".join(
+        "<entry><title>partial</title></entry>" if i in partial else _entry(i)
+        for i in range(start, min(start + count, TOTAL_RESULTS))
+    )
+    return (
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">'
+        f"<opensearch:totalResults>{TOTAL_RESULTS}</opensearch:totalResults>{entries}</feed>"
+    )
+
+
+@pytest.fixture
+def partial_entries() -> Set[int]:
+    """Indices of entries served without their required fields."""
+    return set()
+
+
+@pytest.fixture
+def short_pages() -> Dict[int, List[int]]:
+    """Entry counts served, one per request, in place of the full page at each `start`."""
+    return {}
+
+
+@pytest.fixture
+def requested_starts(
+    monkeypatch: pytest.MonkeyPatch, partial_entries: Set[int], short_pages: Dict[int, List[int]]
+) -> List[int]:
+    """Serves generated pages from a mock transport and records each requested `start`."""
+    from nonebot_plugin_literature.arxivreq import client
+
+    starts: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = parse_qs(urlparse(str(request.url)).query)
+        start, max_results = int(query["start"][0]), int(query["max_results"][0])
+        starts.append(start)
+        counts = short_pages.get(start)
+        count = counts.pop(0) if counts else max_results
+        return httpx.Response(200, text=_page(start, count, partial_entries))
+
+    monkeypatch.setattr(client, "_DEFAULT_CLIENT", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(client, "_DEFAULT_CACHE_DIR", None)
+    monkeypatch.setattr(client, "_PAGE_CACHE", client.TTLCache())
+    return starts
+
+
+def _titles(results) -> List[str]:
+    return [result.title for result in results]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("client_name", ["BasicClient", "AsyncClient"])
+async def test_results_are_yielded_in_order(requested_starts: List[int], client_name: str):
+    from nonebot_plugin_literature.arxivreq import Search, client
+
+    api = getattr(client, client_name)(page_size=3, delay_seconds=0.01)
+    results = [result async for result in api.results(Search(query="all:electron"))]
+
+    assert _titles(results) == [f"Paper {i}" for i in range(TOTAL_RESULTS)]
+    assert sorted(requested_starts) == [0, 3, 6]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("client_name", ["BasicClient", "AsyncClient"])
+async def test_max_results_limits_results_and_requests(requested_starts: List[int], client_name: str):
+    from nonebot_plugin_literature.arxivreq import Search, client
+
+    api = getattr(client, client_name)(page_size=2, delay_seconds=0.01)
+    results = [result async for result in api.results(Search(query="all:electron", max_results=2))]
+
+    assert _titles(results) == ["Paper 0", "Paper 1"]
+    assert requested_starts == [0]
+
+
+@pytest.mark.asyncio
+async def test_partial_entries_are_skipped(requested_starts: List[int], partial_entries: Set[int]):
+    from nonebot_plugin_literature.arxivreq import Search, client
+
+    partial_entries.update({1, 4})
+    api = client.BasicClient(page_size=3, delay_seconds=0.01)
+    results = [result async for result in api.results(Search(query="all:electron"))]
+
+    assert _titles(results) == ["Paper 0", "Paper 2", "Paper 3", "Paper 5", "Paper 6"]
+
+
+@pytest.mark.asyncio
+async def test_parsed_pages_are_reused(requested_starts: List[int]):
+    from nonebot_plugin_literature.arxivreq import Search, client
+
+    search = Search(query="all:electron")
+    first = [result async for result in client.BasicClient(page_size=3, delay_seconds=0.01).results(search)]
+    second = [result async for result in client.BasicClient(page_size=3, delay_seconds=0.01).results(search)]
+
+    assert sorted(requested_starts) == [0, 3, 6]
+    assert first == second
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("client_name", ["BasicClient", "AsyncClient"])
+async def test_transient_empty_page_is_retried(
+    requested_starts: List[int], short_pages: Dict[int, List[int]], client_name: str
+):
+    from nonebot_plugin_literature.arxivreq import Search, client
+
+    short_pages[3] = [0]
+    api = getattr(client, client_name)(page_size=3, delay_seconds=0.01)
+    results = [result async for result in api.results(Search(query="all:electron"))]
+
+    assert _titles(results) == [f"Paper {i}" for i in range(TOTAL_RESULTS)]
+    assert sorted(requested_starts) == [0, 3, 3, 6]
+
+
+@pytest.mark.asyncio
+async def test_persistently_empty_page_raises(requested_starts: List[int], short_pages: Dict[int, List[int]]):
+    from nonebot_plugin_literature.arxivreq import Search, client
+    from nonebot_plugin_literature.arxivreq.exception import UnexpectedEmptyPageError
+
+    short_pages[3] = [0, 0]
+    api = client.BasicClient(page_size=3, delay_seconds=0.01, num_retries=1)
+
+    with pytest.raises(UnexpectedEmptyPageError):
+        [result async for result in api.results(Search(query="all:electron"))]
+    assert requested_starts.count(3) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("client_name", ["BasicClient", "AsyncClient"])
+async def test_short_page_is_completed(
+    requested_starts: List[int], short_pages: Dict[int, List[int]], client_name: str
+):
+    from nonebot_plugin_literature.arxivreq import Search, client
+
+    short_pages[3] = [2]
+    api = getattr(client, client_name)(page_size=3, delay_seconds=0.01)
+    results = [result async for result in api.results(Search(query="all:electron"))]
+
+    assert _titles(results) == [f"Paper {i}" for i in range(TOTAL_RESULTS)]
+    assert 5 in requested_starts
+
+
+@pytest.fixture
+def request_times() -> List[float]:
+    """Monotonic times at which the `failures` transport received each request."""
+    return []
+
+
+@pytest.fixture
+def failures(monkeypatch: pytest.MonkeyPatch, request_times: List[float]) -> List[httpx.Response]:
+    """Responses served, in order, before the first page is; retries back off without jitter."""
+    from nonebot_plugin_literature.arxivreq import client
+
+    responses: List[httpx.Response] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        request_times.append(time.monotonic())
+        if responses:
+            return responses.pop(0)
+        return httpx.Response(200, text=_page(0, 3, set()))
+
+    monkeypatch.setattr(client, "_DEFAULT_CLIENT", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(client, "_DEFAULT_CACHE_DIR", None)
+    monkeypatch.setattr(client, "_PAGE_CACHE", client.TTLCache())
+    monkeypatch.setattr(client.random, "uniform", lambda a, b: b)
+    return responses
+
+
+async def _first_page(api) -> List[str]:
+    from nonebot_plugin_literature.arxivreq import Search
+
+    return _titles([result async for result in api.results(Search(query="all:electron", max_results=3))])
+
+
+def _gaps(times: List[float]) -> List[float]:
+    return [later - earlier for earlier, later in zip(times, times[1:])]
+
+
+@pytest.mark.asyncio
+async def test_server_errors_back_off_exponentially(failures: List[httpx.Response], request_times: List[float]):
+    from nonebot_plugin_literature.arxivreq import client
+
+    failures.extend([httpx.Response(503), httpx.Response(503)])
+    api = client.BasicClient(page_size=3, delay_seconds=0.05, num_retries=2)
+
+    assert await _first_page(api) == ["Paper 0", "Paper 1", "Paper 2"]
+    assert len(request_times) == 3
+    first_gap, second_gap = _gaps(request_times)
+    assert first_gap >= 0.05
+    assert second_gap >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_server_errors_give_up_after_retries(failures: List[httpx.Response], request_times: List[float]):
+    from nonebot_plugin_literature.arxivreq import client
+
+    failures.extend([httpx.Response(503), httpx.Response(503)])
+    api = client.BasicClient(page_size=3, delay_seconds=0.01, num_retries=1)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await _first_page(api)
+    assert len(request_times) == 2
+
+
+@pytest.mark.asyncio
+async def test_too_many_requests_honours_retry_after(failures: List[httpx.Response], request_times: List[float]):
+    from nonebot_plugin_literature.arxivreq import client
+
+    failures.append(httpx.Response(429, headers={"retry-after": "0.2"}))
+    api = client.BasicClient(page_size=3, delay_seconds=0.01)
+
+    assert await _first_page(api) == ["Paper 0", "Paper 1", "Paper 2"]
+    assert _gaps(request_times)[0] >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_capped(failures: List[httpx.Response], request_times: List[float]):
+    from nonebot_plugin_literature.arxivreq import client
+
+    failures.append(httpx.Response(429, headers={"retry-after": "3600"}))
+    api = client.BasicClient(page_size=3, delay_seconds=0.01)
+    api.max_retry_delay = 0.05
+
+    assert await _first_page(api) == ["Paper 0", "Paper 1", "Paper 2"]
+    assert 0.05 <= _gaps(request_times)[0] < 1.0
+
+
+def test_retry_delay_is_capped_by_default():
+    from nonebot_plugin_literature.arxivreq import client
+
+    request = httpx.Request("GET", client.BasicClient.query_url_format)
+    response = httpx.Response(429, headers={"retry-after": "3600"}, request=request)
+    error = httpx.HTTPStatusError("Too Many Requests", request=request, response=response)
+    api = client.BasicClient()
+
+    assert api._retry_delay(error, 0) == 30.0
+    assert api._retry_delay(httpx.ConnectError("refused"), 10) <= 30.0
+
+
+@pytest.mark.asyncio
+async def test_retry_backoff_pushes_back_queued_requests():
+    from nonebot_plugin_literature.arxivreq import client
+
+    api = client.BasicClient(delay_seconds=0.05)
+    started = time.monotonic()
+
+    async def wait(backoff: float) -> float:
+        await api._wait_for_slot(backoff=backoff)
+        return time.monotonic() - started
+
+    retry, queued = await asyncio.gather(wait(0.2), wait(0.0))
+
+    assert retry >= 0.2
+    assert queued >= 0.25
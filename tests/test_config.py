@@ -0,0 +1,25 @@
+import pytest
+from pydantic import ValidationError
+
+
+@pytest.mark.parametrize(
+    ("proxy", "expected"),
+    [
+        ("http://proxy:80", "http://proxy:80"),
+        ("https://proxy:443", "https://proxy:443"),
+        ("http://127.0.0.1:7890", "http://127.0.0.1:7890"),
+        ("https://proxy:8443/", "https://proxy:8443"),
+    ],
+)
+def test_proxy_is_accepted(proxy: str, expected: str):
+    from nonebot_plugin_literature.config import Config
+
+    assert Config(proxy=proxy).proxy == {"http://": expected, "https://": expected}
+
+
+@pytest.mark.parametrize("proxy", ["socks5://proxy:1080", "http://proxy:7890/path", "http://proxy:7890/?a=b"])
+def test_proxy_is_rejected(proxy: str):
+    from nonebot_plugin_literature.config import Config
+
+    with pytest.raises(ValidationError):
+        Config(proxy=proxy)
@@ -0,0 +1,36 @@
+def test_parse_response(response_xml: bytes):
+    from nonebot_plugin_literature.arxivreq import _feed
+
+    feed = _feed.parse(response_xml)
+
+    assert not feed.bozo
+    assert feed.feed.opensearch_totalresults == "204910"
+    assert feed.feed.opensearch_itemsperpage == "1"
+    assert len(feed.entries) == 1
+    entry = feed.entries[0]
+    assert entry.id == "http://arxiv.org/abs/cond-mat/0102536v1"
+    assert entry.updated_parsed.tm_year == 2001
+    assert [author.name for author in entry.authors][:2] == ["David Prendergast", "M. Nolan"]
+    assert entry.authors[1].arxiv_affiliation == "NMRC, University College, Cork, Ireland"
+    assert entry.arxiv_primary_category["term"] == "cond-mat.str-el"
+    assert [tag.term for tag in entry.tags] == ["cond-mat.str-el"]
+    assert entry.arxiv_doi == "10.1063/1.1383585"
+    assert len(entry.links) == 3
+
+
+def test_parse_invalid_body():
+    from nonebot_plugin_literature.arxivreq import _feed
+
+    feed = _feed.parse(b"")
+
+    assert feed.bozo
+    assert feed.entries == []
+
+
+def test_parse_unparseable_date_is_left_out():
+    from nonebot_plugin_literature.arxivreq import _feed
+
+    feed = _feed.parse(b'<feed xmlns="http://www.w3.org/2005/Atom"><entry><updated>bogus</updated></entry></feed>')
+
+    assert feed.entries[0].updated == "bogus"
+    assert "updated_parsed" not in feed.entries[0]
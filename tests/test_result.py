@@ -0,0 +1,61 @@
+import pytest
+
+
+def test_from_feed_entry(response_xml: bytes):
+    from nonebot_plugin_literature.arxivreq import Result, _feed
+
+    result = Result._from_feed_entry(_feed.parse(response_xml).entries[0])
+
+    assert result.entry_id == "http://arxiv.org/abs/cond-mat/0102536v1"
+    assert result.title == "Impact of Electron-Electron Cusp on Configuration Interaction Energies"
+    assert result.published.year == 2001
+    assert result.authors[0] == Result.Author("David Prendergast")
+    assert result.primary_category == "cond-mat.str-el"
+    assert result.pdf_url == "http://arxiv.org/pdf/cond-mat/0102536v1"
+    assert result.get_short_id() == "cond-mat/0102536v1"
+
+
+def test_repeated_entries_build_independent_results(response_xml: bytes):
+    from nonebot_plugin_literature.arxivreq import Result, _feed
+
+    entry = _feed.parse(response_xml).entries[0]
+    first = Result._from_feed_entry(entry)
+    first.title = "mutated"
+    first.authors.append(Result.Author("Someone Else"))
+    second = Result._from_feed_entry(entry)
+
+    assert second is not first
+    assert second.title == "Impact of Electron-Electron Cusp on Configuration Interaction Energies"
+    assert Result.Author("Someone Else") not in second.authors
+    assert second.published is first.published
+
+
+@pytest.mark.parametrize(
+    ("entry", "missing_field"),
+    [
+        ("<entry><title>t</title></entry>", "id"),
+        ("<entry><id>x</id><title>t</title><summary>s</summary></entry>", "updated_parsed"),
+        (
+            "<entry><id>x</id><updated>bogus</updated><published>2001-02-28T20:12:09Z</published></entry>",
+            "updated_parsed",
+        ),
+    ],
+)
+def test_partial_entry_raises_missing_field(entry: str, missing_field: str):
+    from nonebot_plugin_literature.arxivreq import Result, _feed
+
+    feed = _feed.parse(f'<feed xmlns="http://www.w3.org/2005/Atom">{entry}</feed>'.encode())
+
+    with pytest.raises(Result.MissingFieldError) as exc_info:
+        Result._from_feed_entry(feed.entries[0])
+    assert exc_info.value.missing_field == missing_field
+
+
+def test_author_and_link_have_tuple_semantics():
+    from nonebot_plugin_literature.arxivreq import Result
+
+    assert Result.Author("x") == ("x",)
+    assert hash(Result.Author("x")) == hash(("x",))
+    assert Result.Link("h") == ("h", None, None, None)
+    assert Result.Link("h", title="pdf") != Result.Link("h")
+    assert len({Result.Link("h"), Result.Link("h"), Result.Link("h", title="pdf")}) == 2
@@ -0,0 +1,32 @@
+def test_url_args_follow_updated_criteria():
+    from nonebot_plugin_literature.arxivreq import Search, SortOrder
+
+    search = Search(query="a")
+    assert search.url_args()["search_query"] == "a"
+
+    search.query = "b"
+    search.id_list = ["2101.00001"]
+    search.sort_order = SortOrder.Ascending
+
+    assert search.url_args() == {
+        "search_query": "b",
+        "id_list": "2101.00001",
+        "sortBy": "relevance",
+        "sortOrder": "ascending",
+    }
+
+
+def test_request_urls_follow_updated_criteria():
+    from nonebot_plugin_literature.arxivreq import Search
+    from nonebot_plugin_literature.arxivreq.client import BasicClient
+
+    search = Search(query="a")
+    client = BasicClient()
+    assert "search_query=a&" in client._format_url(search, 0, 10)
+
+    search.query = "b c"
+
+    assert search.encoded_url_args() == "search_query=b+c&id_list=&sortBy=relevance&sortOrder=descending"
+    assert client._format_url(search, 10, 10).endswith(
+        "?search_query=b+c&id_list=&sortBy=relevance&sortOrder=descending&start=10&max_results=10"
+    )
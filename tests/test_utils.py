@@ -0,0 +1,38 @@
+from pathlib import Path
+
+
+def test_atom_parser(response_xml: bytes):
+    from nonebot_plugin_literature.utils import atom_parser
+
+    feed = atom_parser(response_xml)
+
+    assert feed.id == "http://arxiv.org/api/cHxbiOdZaP56ODnBPIenZhzg5f8"
+    assert feed.link.startswith("http://arxiv.org/api/query?")
+    assert (feed.total_results, feed.start_index, feed.items_per_page) == (204910, 0, 1)
+    assert len(feed.entries) == 1
+    entry = feed.entries[0]
+    assert entry.title == "Impact of Electron-Electron Cusp on Configuration Interaction Energies"
+    assert entry.authors[0].name == "David Prendergast"
+    assert entry.authors[0].affiliation == "Department of Physics"
+    assert entry.primary_category == "cond-mat.str-el"
+    assert entry.categories == ["cond-mat.str-el"]
+    assert entry.links == [
+        "http://dx.doi.org/10.1063/1.1383585",
+        "http://arxiv.org/abs/cond-mat/0102536v1",
+        "http://arxiv.org/pdf/cond-mat/0102536v1",
+    ]
+    assert entry.journal_ref == "J. Chem. Phys. 115, 1626 (2001)"
+
+
+def test_iter_entries_matches_atom_parser(response_xml: bytes):
+    from nonebot_plugin_literature.utils import atom_parser, iter_entries
+
+    assert list(iter_entries(response_xml)) == atom_parser(response_xml).entries
+
+
+def test_load_xml(response_xml: bytes):
+    from nonebot_plugin_literature.utils import load_xml
+
+    assert load_xml(Path(__file__).parent / "response.xml") == response_xml
+    assert load_xml(response_xml.decode()) == response_xml
+    assert load_xml(response_xml) is response_xml